@@ -0,0 +1,35 @@
+"""Cost of the automatic unescaping pass against NegString wrappers.
+
+Run with ``python benchmarks/bench_autounescape.py``.
+"""
+
+import time
+
+from negargparse.negargparse import NegativeArgumentParser, NegString
+
+
+def bench(label, parser, args):
+    best = float("inf")
+    for _ in range(3):
+        start = time.perf_counter()
+        parser.parse_args(args)
+        best = min(best, time.perf_counter() - start)
+    print(f"  {label:<20} {best:8.3f} s {best / len(args) * 1e9:8.0f} ns/value")
+
+
+def main():
+    args = [str(-value) for value in range(1, 1_000_001)]
+    auto = NegativeArgumentParser()
+    auto.add_argument("values", nargs="+")
+    wrapped = NegativeArgumentParser(autounescape=False)
+    wrapped.add_argument("values", nargs="+", type=NegString)
+    plain = NegativeArgumentParser(autounescape=False)
+    plain.add_argument("values", nargs="+")
+    print(f"{len(args)} negative values")
+    bench("escaped, no unescape", plain, args)
+    bench("type=NegString", wrapped, args)
+    bench("autounescape", auto, args)
+
+
+if __name__ == "__main__":
+    main()
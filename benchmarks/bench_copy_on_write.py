@@ -0,0 +1,47 @@
+"""Peak memory of escaping a large argv, copying eagerly or on write.
+
+Run with ``python benchmarks/bench_copy_on_write.py``.
+"""
+
+import time
+import tracemalloc
+
+from negargparse.negargparse import NegativeArgumentParser
+
+SIZE = 500_000
+
+
+def eager(parser, args):
+    """The previous approach: always build a new escaped list."""
+    escaped = parser.negargescaper.escape_many(args)
+    return escaped, {id(new): old for old, new in zip(args, escaped) if new is not old}
+
+
+def measure(func, *args):
+    tracemalloc.start()
+    start = time.perf_counter()
+    result = func(*args)
+    elapsed = time.perf_counter() - start
+    peak = tracemalloc.get_traced_memory()[1]
+    tracemalloc.stop()
+    del result
+    return peak, elapsed
+
+
+def main():
+    parser = NegativeArgumentParser()
+    parser.add_argument("files", nargs="*")
+    paths = [f"/srv/jobs/run_{i:06d}/input.dat" for i in range(SIZE)]
+    late = paths[:-1] + ["-1"]
+    cow = NegativeArgumentParser._escapeargs
+    print(f"{SIZE} arguments{'peak MiB':>22}{'seconds':>10}")
+    for name, args in (("no escaping", paths), ("last escaped", late)):
+        for label, func in (("eager", eager), ("copy-on-write", cow)):
+            peak, elapsed = measure(func, parser, args)
+            print(f"  {name:<13} {label:<14} {peak / 2**20:8.1f} {elapsed:9.3f}")
+    peak, elapsed = measure(parser.parse_known_args, paths)
+    print(f"  parse_known_args, no escaping {peak / 2**20:8.1f} {elapsed:9.3f}")
+
+
+if __name__ == "__main__":
+    main()
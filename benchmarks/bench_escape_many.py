@@ -0,0 +1,33 @@
+"""Scaling of per-argument escaping against the batch escape_many path.
+
+Run with ``python benchmarks/bench_escape_many.py``.
+"""
+
+import timeit
+
+from negargparse.negargparse import NegativeArgumentParser
+
+
+def best(func, number):
+    return min(timeit.repeat(func, number=number, repeat=5)) / number
+
+
+def main():
+    escaper = NegativeArgumentParser.negargescaper
+    print(f"{'argv size':>10} {'per-arg ns':>11} {'batch ns':>9} {'speedup':>8}")
+    for size in (10, 100, 1_000, 10_000, 100_000, 1_000_000):
+        args = [
+            f"-{i}" if i % 10 == 0 else f"/srv/jobs/run_{i:07d}.dat"
+            for i in range(size)
+        ]
+        number = max(1, 1_000_000 // size)
+        loop = best(lambda: [escaper.escape(arg) for arg in args], number)
+        batch = best(lambda: escaper.escape_many(args), number)
+        print(
+            f"{size:>10} {loop / size * 1e9:>11.1f} {batch / size * 1e9:>9.1f}"
+            f" {loop / batch:>7.2f}x"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,40 @@
+"""Five-stage parser chain with plain lists and with EscapedArgv.
+
+Run with ``python benchmarks/bench_escaped_argv.py``.
+"""
+
+import time
+
+from negargparse.negargparse import NegativeArgumentParser, NegInt
+
+
+def chain(parsers, rest):
+    for parser in parsers:
+        namespace, rest = parser.parse_known_args(rest)
+    return rest
+
+
+def main():
+    args = ["--config", "-1", "-a", "-2", "-b", "-3", "-c", "-4", "-d", "-5"]
+    args += [str(-value) for value in range(1, 1_000_001)]
+    bootstrap = NegativeArgumentParser()
+    bootstrap.add_argument("--config")
+    parsers = [bootstrap]
+    for option in "abcd":
+        parsers.append(NegativeArgumentParser())
+        parsers[-1].add_argument(f"-{option}", type=NegInt)
+    print(f"{len(args)} arguments, {len(parsers)} parsers")
+    for label, prepare in (
+        ("plain list", list),
+        ("EscapedArgv", bootstrap.escape_args),
+    ):
+        best = float("inf")
+        for _ in range(3):
+            start = time.perf_counter()
+            chain(parsers, prepare(args))
+            best = min(best, time.perf_counter() - start)
+        print(f"  {label:<12} {best:8.3f} s")
+
+
+if __name__ == "__main__":
+    main()
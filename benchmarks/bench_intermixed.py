@@ -0,0 +1,40 @@
+"""Intermixed parsing of a large argument list.
+
+Run with ``python benchmarks/bench_intermixed.py``.
+"""
+
+import time
+
+from negargparse.negargparse import NegativeArgumentParser, NegNumberEscaper
+
+
+class CountingEscaper(NegNumberEscaper):
+    calls = 0
+
+    def escape(self, string):
+        CountingEscaper.calls += 1
+        return super().escape(string)
+
+
+def main():
+    # argparse is quadratic in the number of alternations between optionals
+    # and positionals, so these come in two large blocks.
+    size = 1_000_000
+    args = [str(-value) for value in range(1, size + 1)] + ["-x", "-1"] * 1000
+    NegativeArgumentParser.negargescaper = CountingEscaper()
+    parser = NegativeArgumentParser()
+    parser.add_argument("-x", action="append")
+    parser.add_argument("values", nargs="*")
+    best = float("inf")
+    for _ in range(3):
+        CountingEscaper.calls = 0
+        start = time.perf_counter()
+        parser.parse_intermixed_args(args)
+        best = min(best, time.perf_counter() - start)
+    print(f"{len(args)} arguments")
+    print(f"  parse_intermixed_args {best:8.3f} s")
+    print(f"  escape calls          {CountingEscaper.calls:8d}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,42 @@
+"""LiteralEscaper against RegexEscaper on large literal-rule payloads.
+
+Run with ``python benchmarks/bench_literalescaper.py``.
+"""
+
+import json
+import timeit
+
+from negargparse.negargparse import LiteralEscaper, RegexEscaper
+
+RULES = (
+    [("&", "&amp;"), ("<", "&lt;"), (">", "&gt;"), ('"', "&quot;"), ("'", "&#x27;")],
+    [("&#x27;", "'"), ("&quot;", '"'), ("&gt;", ">"), ("&lt;", "<"), ("&amp;", "&")],
+)
+
+PAYLOADS = {
+    "paths": " ".join(f"/srv/jobs/run_{i:06d}/input.dat" for i in range(4000)),
+    "json": json.dumps([{"id": i, "tags": ["a", "b"]} for i in range(4000)]),
+    "html": "<p class='x'>Tom &amp; Jerry say \"hi\"</p>\n" * 3000,
+}
+
+
+def bench(label, func, string):
+    seconds = min(timeit.repeat(lambda: func(string), number=3, repeat=3)) / 3
+    mbps = len(string) / seconds / 1e6
+    print(f"  {label:<18} {seconds * 1e3:8.2f} ms {mbps:9.1f} MB/s")
+
+
+def main():
+    regex = RegexEscaper(*RULES)
+    literal = LiteralEscaper(*RULES)
+    for name, payload in PAYLOADS.items():
+        escaped = regex.escape(payload)
+        print(f"{name}, {len(payload)} characters")
+        bench("regex escape", regex.escape, payload)
+        bench("literal escape", literal.escape, payload)
+        bench("regex unescape", regex.unescape, escaped)
+        bench("literal unescape", literal.unescape, escaped)
+
+
+if __name__ == "__main__":
+    main()
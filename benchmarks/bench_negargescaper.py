@@ -0,0 +1,36 @@
+"""Cost of escaping a large argv of file paths with the default escaper.
+
+Run with ``python benchmarks/bench_negargescaper.py``.
+"""
+
+import timeit
+
+from negargparse.negargparse import NegNumberEscaper, RegexEscaper
+
+REGEX = RegexEscaper(
+    [(r"\A(\\*-\d)", r"\\\1")],
+    [(r"\A\\(\\*-\d)", r"\1")],
+)
+PREFIX = NegNumberEscaper()
+
+
+def bench(label, escaper, args):
+    escape = escaper.escape
+    seconds = min(
+        timeit.repeat(lambda: [escape(arg) for arg in args], number=1, repeat=5)
+    )
+    per_arg = seconds / len(args) * 1e9
+    print(f"  {label:<8} {seconds * 1e3:8.1f} ms {per_arg:6.0f} ns/arg")
+
+
+def main():
+    paths = [f"/srv/jobs/run_{i:06d}/input.dat" for i in range(500_000)]
+    mixed = [f"-{i}" if i % 10 == 0 else path for i, path in enumerate(paths)]
+    for name, args in (("paths", paths), ("10% negative", mixed)):
+        print(f"{name}, {len(args)} arguments")
+        bench("regex", REGEX, args)
+        bench("prefix", PREFIX, args)
+
+
+if __name__ == "__main__":
+    main()
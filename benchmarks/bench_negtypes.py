@@ -0,0 +1,41 @@
+"""Cost of the Neg* converters on a 1M-element ``nargs='+'`` parse.
+
+Run with ``python benchmarks/bench_negtypes.py``.
+"""
+
+import timeit
+
+from negargparse.negargparse import NegativeArgumentParser, NegInt, RegexEscaper
+
+REGEX = RegexEscaper(
+    [(r"\A(\\*-\d)", r"\\\1")],
+    [(r"\A\\(\\*-\d)", r"\1")],
+)
+SIZE = 1_000_000
+
+
+def best(func):
+    return min(timeit.repeat(func, number=1, repeat=3))
+
+
+def main():
+    parser = NegativeArgumentParser()
+    parser.add_argument("n", type=NegInt, nargs="+")
+    args = [str(-i if i % 2 else i) for i in range(SIZE)]
+    escaped = NegativeArgumentParser.negargescaper.escape_many(args)
+
+    # Outside of a parse the converters fall back to unescaping each value.
+    default = NegativeArgumentParser.negargescaper
+    print(f"{SIZE} values")
+    for name, escaper in (("regex", REGEX), ("default", default)):
+        NegativeArgumentParser.negargescaper = escaper
+        print(f"  {name} escaper")
+        convert = best(lambda: list(map(NegInt, escaped)))
+        parse = best(lambda: parser.parse_args(args))
+        print(f"    convert, unescaping    {convert:.3f} s")
+        print(f"    parse_args             {parse:.3f} s")
+    NegativeArgumentParser.negargescaper = default
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,42 @@
+"""Throughput of parse_many against the number of worker threads.
+
+Run with ``python benchmarks/bench_parse_many.py``, preferably on a
+free-threaded build of CPython (3.13t or later), where the parses can run in
+parallel. With the GIL the workers take turns and throughput stays flat.
+"""
+
+import os
+import sys
+import sysconfig
+import time
+
+from negargparse.negargparse import NegativeArgumentParser, NegFloat, NegInt
+
+
+def main():
+    parser = NegativeArgumentParser()
+    parser.add_argument("-n", type=NegInt)
+    parser.add_argument("-r", "--ra")
+    parser.add_argument("-d", "--dec")
+    parser.add_argument("values", nargs="*", type=NegFloat)
+    argvs = [
+        ["-n", str(-i), "-r", "14:29:43", "-d", "-62:50:02"]
+        + [str(-value / 7) for value in range(20)]
+        for i in range(20_000)
+    ]
+    gil = getattr(sys, "_is_gil_enabled", lambda: True)()
+    print(
+        f"Python {sys.version.split()[0]}, {os.cpu_count()} CPUs, "
+        f"free-threaded build: {bool(sysconfig.get_config_var('Py_GIL_DISABLED'))}, "
+        f"GIL enabled: {gil}"
+    )
+    print(f"{len(argvs)} command lines of {len(argvs[0])} arguments")
+    for workers in (1, 2, 4, 8):
+        start = time.perf_counter()
+        parser.parse_many(argvs, workers=workers)
+        seconds = time.perf_counter() - start
+        print(f"  {workers} workers {len(argvs) / seconds:10.0f} parses/s")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,37 @@
+"""Cost of a short option head followed by ``--`` and a 1M-element tail.
+
+Run with ``python benchmarks/bench_pseudo_argument.py``.
+"""
+
+import timeit
+
+from negargparse.negargparse import NegativeArgumentParser, NegInt
+
+SIZE = 1_000_000
+
+
+def best(func):
+    return min(timeit.repeat(func, number=1, repeat=5))
+
+
+def main():
+    parser = NegativeArgumentParser()
+    parser.add_argument("-n", type=NegInt)
+    parser.add_argument("command", nargs="*")
+    tail = [f"-{i}" if i % 2 else f"arg{i}" for i in range(SIZE)]
+    for head in (["-n", "3"], ["-n", "-3"]):
+        args = head + ["--"] + tail
+        # Without the sentinel every tail element has to be escaped.
+        everything = head + tail
+        print(f"head {head}, tail of {SIZE}")
+        timings = (
+            ("escape, no sentinel", lambda: parser._escapeargs(everything)),
+            ("escape, sentinel", lambda: parser._escapeargs(args)),
+            ("parse_known_args", lambda: parser.parse_known_args(args)),
+        )
+        for label, func in timings:
+            print(f"  {label:<20} {best(func):.3f} s")
+
+
+if __name__ == "__main__":
+    main()
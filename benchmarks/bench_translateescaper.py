@@ -0,0 +1,46 @@
+"""TranslateEscaper against RegexEscaper on the HTML test corpus.
+
+Run with ``python benchmarks/bench_translateescaper.py``.
+"""
+
+import timeit
+
+from negargparse.negargparse import RegexEscaper, TranslateEscaper
+
+HTML_RULES = (
+    [("&", "&amp;"), ("<", "&lt;"), (">", "&gt;"), ('"', "&quot;"), ("'", "&#x27;")],
+    [("&#x27;", "'"), ("&quot;", '"'), ("&gt;", ">"), ("&lt;", "<"), ("&amp;", "&")],
+)
+# The same characters mapped one for one, which str.translate handles in C.
+CHARMAP_RULES = (
+    [("&", "%"), ("<", ","), (">", ";"), ('"', "!"), ("'", "`")],
+    [("%", "&"), (",", "<"), (";", ">"), ("!", '"'), ("`", "'")],
+)
+# Strings from tests/test_escaper.py
+CORPUS = (
+    '<meta http-equiv="Content-Type" content="text/html; charset=utf-8">'
+    "&lt; & that &<  what '\"triple quoted\"'"
+)
+
+
+def bench(label, func, string):
+    seconds = min(timeit.repeat(lambda: func(string), number=3, repeat=3)) / 3
+    mbps = len(string) / seconds / 1e6
+    print(f"  {label:<13} {seconds * 1e3:8.2f} ms {mbps:8.1f} MB/s")
+
+
+def main():
+    for megabytes in (1, 8):
+        for suffix in ("", "é"):
+            corpus = (CORPUS + suffix) * (megabytes * 1_000_000 // len(CORPUS))
+            kind = "non-ASCII" if suffix else "ASCII"
+            for name, rules in (("HTML", HTML_RULES), ("charmap", CHARMAP_RULES)):
+                print(f"{name} rules, {kind}, {len(corpus) / 1e6:.1f} MB")
+                bench("regex", RegexEscaper(*rules).escape, corpus)
+                bench("translate", TranslateEscaper(*rules).escape, corpus)
+                table = str.maketrans(dict(rules[0]))
+                bench("str.translate", lambda s: s.translate(table), corpus)
+
+
+if __name__ == "__main__":
+    main()
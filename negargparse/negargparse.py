@@ -32,17 +32,42 @@
 
 __all__ = [
     "NegativeArgumentParser",
+    "EscapedArgv",
+    "ParserExit",
     "NegInt",
     "NegFloat",
     "NegString",
 ]
 
+import multiprocessing as _multiprocessing
+import os as _os
 import re as _re
+import shlex as _shlex
 import sys as _sys
+import threading as _threading
 
 import argparse
-from functools import partial
-from typing import Callable, Sequence, Type
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import contextmanager
+from contextvars import ContextVar
+from functools import lru_cache, partial
+from heapq import heapify, heappop, heapreplace
+from itertools import combinations, islice
+from typing import (
+    Any,
+    Callable,
+    Iterable,
+    Iterator,
+    List,
+    NamedTuple,
+    NoReturn,
+    Optional,
+    Sequence,
+    Type,
+    TypeVar,
+    Union,
+)
 
 try:
     from typing import Protocol
@@ -50,7 +75,7 @@
     from typing_extensions import Protocol  # type: ignore
 
 
-class Escaper(Protocol):
+class StringEscaper(Protocol):
     def escape(self, string: str) -> str:
         ...
 
@@ -58,12 +83,93 @@ def unescape(self, string: str) -> str:
         ...
 
 
+class Escaper(StringEscaper, Protocol):
+    def escape_many(self, strings: Iterable[str]) -> list[str]:
+        ...
+
+    def unescape_many(self, strings: Iterable[str]) -> list[str]:
+        ...
+
+
+class BatchEscaper:
+    """Adapter giving a per-string escaper the batch methods of ``Escaper``."""
+
+    def __init__(self, escaper: StringEscaper) -> None:
+        self.escaper = escaper
+
+    def escape(self, string: str) -> str:
+        return self.escaper.escape(string)
+
+    def unescape(self, string: str) -> str:
+        return self.escaper.unescape(string)
+
+    def escape_many(self, strings: Iterable[str]) -> list[str]:
+        return list(map(self.escaper.escape, strings))
+
+    def unescape_many(self, strings: Iterable[str]) -> list[str]:
+        return list(map(self.escaper.unescape, strings))
+
+
+_REGEX_METACHARS = frozenset(".^$*+?{}[]\\|()")
+
+
+def _isliteral(rule: tuple[str, str]) -> bool:
+    """Whether a rule matches a fixed string and inserts a fixed string."""
+    pattern, replacement = rule
+    return (
+        bool(pattern)
+        and _REGEX_METACHARS.isdisjoint(pattern)
+        and "\\" not in replacement
+    )
+
+
+def _overlaps(first: str, second: str) -> bool:
+    """Whether occurrences of two non-empty strings can share characters."""
+    if not first or not second:
+        return False
+    if first in second or second in first:
+        return True
+    return any(
+        first.endswith(second[:n]) or second.endswith(first[:n])
+        for n in range(1, min(len(first), len(second)))
+    )
+
+
+def _independent(escapetemplate: list[tuple[str, str]]) -> bool:
+    """Whether sequential application of literal rules equals a single pass.
+
+    This holds when no two patterns can overlap and no pattern can match
+    text produced (or joined together) by the replacement of an earlier rule.
+    """
+    for (pattern, replacement), (later, _) in combinations(escapetemplate, 2):
+        if _overlaps(pattern, later) or _overlaps(replacement, later):
+            return False
+        if not replacement and len(later) > 1:
+            return False
+    return True
+
+
 class RegexEscaper:
+    """Escaper applying a list of ``(pattern, replacement)`` rules in order.
+
+    Each rule is equivalent to a ``re.sub`` pass over the result of the
+    previous one. Where that is provably the same as a single scan, e.g. for
+    non-interacting literal rules, the rules are compiled into one alternation
+    and every string is scanned only once.
+    """
+
     def __init__(
         self, escapes: list[tuple[str, str]], unescapes: list[tuple[str, str]]
     ) -> None:
+        self._rules = (escapes, unescapes)
         self.escapes = self._compileescapes(escapes)
         self.unescapes = self._compileescapes(unescapes)
+        self._escape = self._compilesubstitution(escapes)
+        self._unescape = self._compilesubstitution(unescapes)
+
+    def __reduce__(self) -> tuple[Any, ...]:
+        # Pickled as its rules, the patterns are compiled again when loaded.
+        return type(self), self._rules
 
     @staticmethod
     def _compileescapes(
@@ -71,25 +177,570 @@ def _compileescapes(
     ) -> list[Callable[[str], str]]:
         return [partial(_re.compile(et[0]).sub, et[1]) for et in escapetemplate]
 
+    @classmethod
+    def _compilesubstitution(
+        cls, escapetemplate: list[tuple[str, str]]
+    ) -> Callable[[str], str]:
+        if len(escapetemplate) == 1:
+            return cls._compileescapes(escapetemplate)[0]
+        # Single characters are found by a fast literal search, so separate
+        # passes beat a character set alternation for them.
+        if (
+            any(len(et[0]) > 1 for et in escapetemplate)
+            and all(map(_isliteral, escapetemplate))
+            and _independent(escapetemplate)
+        ):
+            combined = _re.compile("(" + "|".join(et[0] for et in escapetemplate) + ")")
+            return partial(
+                cls._dispatch, pattern=combined, replacements=dict(escapetemplate)
+            )
+        return partial(cls._substitute, escapes=cls._compileescapes(escapetemplate))
+
     @staticmethod
     def _substitute(string: str, escapes: list[Callable[[str], str]]) -> str:
         for escaper in escapes:
             string = escaper(string)
         return string
 
+    @staticmethod
+    def _dispatch(
+        string: str, pattern: _re.Pattern[str], replacements: dict[str, str]
+    ) -> str:
+        # Splitting on the single group interleaves the matched literals with
+        # the text between them, and each literal identifies its rule.
+        parts = pattern.split(string)
+        if len(parts) == 1:
+            return string
+        parts[1::2] = map(replacements.__getitem__, parts[1::2])
+        return "".join(parts)
+
     def escape(self, string: str) -> str:
-        return self._substitute(string, self.escapes)
+        return self._escape(string)
 
     def unescape(self, string: str) -> str:
-        return self._substitute(string, self.unescapes)
+        return self._unescape(string)
 
+    def escape_many(self, strings: Iterable[str]) -> list[str]:
+        return list(map(self._escape, strings))
 
-class NegativeArgumentParser(argparse.ArgumentParser):
-    negargescaper: Escaper = RegexEscaper(
-        [(r"\A(\\*-\d)", r"\\\1")],
-        [(r"\A\\(\\*-\d)", r"\1")],
+    def unescape_many(self, strings: Iterable[str]) -> list[str]:
+        return list(map(self._unescape, strings))
+
+
+class _LiteralAutomaton:
+    """Aho-Corasick automaton replacing literal patterns in one scan.
+
+    Matches follow regex alternation semantics: the leftmost match wins and,
+    among matches starting at the same position, the earliest rule. Work is
+    linear in the length of the string, plus at most the longest pattern for
+    each replacement made.
+    """
+
+    def __init__(self, rules: list[tuple[str, str]]) -> None:
+        goto: list[dict[str, int]] = [{}]
+        depth = [0]
+        terminal: list[Optional[int]] = [None]
+        for index, (pattern, _) in enumerate(rules):
+            if not pattern:
+                raise ValueError("literal patterns must not be empty")
+            state = 0
+            for char in pattern:
+                if char not in goto[state]:
+                    goto[state][char] = len(goto)
+                    goto.append({})
+                    depth.append(depth[state] + 1)
+                    terminal.append(None)
+                state = goto[state][char]
+            if terminal[state] is None:
+                terminal[state] = index
+
+        # Complete the transitions along failure links breadth first, so
+        # each state's fallback is finished before the state itself.
+        delta: list[dict[str, int]] = [{} for _ in goto]
+        outputs: list[tuple[tuple[int, int], ...]] = [() for _ in goto]
+        fail = [0] * len(goto)
+        delta[0] = dict(goto[0])
+        queue = deque(goto[0].values())
+        while queue:
+            state = queue.popleft()
+            delta[state] = {**delta[fail[state]], **goto[state]}
+            found = terminal[state]
+            own = () if found is None else ((depth[state], found),)
+            outputs[state] = own + outputs[fail[state]]
+            for char, child in goto[state].items():
+                fail[child] = delta[fail[state]].get(char, 0)
+                queue.append(child)
+        for char, child in goto[0].items():
+            delta[0][char] = child
+
+        self.firsts = tuple(goto[0])
+        self.delta = delta
+        self.depth = depth
+        self.outputs = outputs
+        self.replacements = [rule[1] for rule in rules]
+
+    def __call__(self, string: str) -> str:
+        length = len(string)
+        # Heap of the next occurrence of each character that can begin a
+        # match, so that text between matches is skipped by str.find.
+        upcoming = [(string.find(char), char) for char in self.firsts]
+        upcoming = [item for item in upcoming if item[0] >= 0]
+        if not upcoming:
+            return string
+        heapify(upcoming)
+        delta, depth, outputs = self.delta, self.depth, self.outputs
+        pieces = []
+        emitted = 0
+        state = 0
+        # The pending match, which is final once no partial match can still
+        # start at or before its start.
+        start = end = rule = -1
+        position = 0
+        while position < length or rule >= 0:
+            if state == 0 and rule < 0:
+                while upcoming and upcoming[0][0] < position:
+                    char = upcoming[0][1]
+                    found = string.find(char, position)
+                    if found < 0:
+                        heappop(upcoming)
+                    else:
+                        heapreplace(upcoming, (found, char))
+                if not upcoming:
+                    break
+                position = upcoming[0][0]
+            if position < length:
+                state = delta[state].get(string[position], 0)
+                if rule < 0 or position - depth[state] < start:
+                    for size, index in outputs[state]:
+                        begin = position - size + 1
+                        if (
+                            rule < 0
+                            or begin < start
+                            or (begin == start and index < rule)
+                        ):
+                            start, end, rule = begin, position + 1, index
+                    position += 1
+                    continue
+            # Rescan from the end of the replaced text.
+            pieces.append(string[emitted:start])
+            pieces.append(self.replacements[rule])
+            emitted = position = end
+            state = 0
+            rule = -1
+        if not pieces:
+            return string
+        pieces.append(string[emitted:])
+        return "".join(pieces)
+
+
+class LiteralEscaper:
+    """Escaper replacing fixed strings with an Aho-Corasick automaton.
+
+    Patterns and replacements are plain strings, not regular expressions or
+    templates. Each string is scanned once, and a rule set matches as a regex
+    alternation of its patterns would; see ``make_escaper`` for when that is
+    the same as the sequential ``RegexEscaper`` semantics.
+    """
+
+    def __init__(
+        self, escapes: list[tuple[str, str]], unescapes: list[tuple[str, str]]
+    ) -> None:
+        self._rules = (escapes, unescapes)
+        self._escape = _LiteralAutomaton(escapes)
+        self._unescape = _LiteralAutomaton(unescapes)
+
+    def __reduce__(self) -> tuple[Any, ...]:
+        # Pickled as its rules, the automata are built again when loaded.
+        return type(self), self._rules
+
+    def escape(self, string: str) -> str:
+        return self._escape(string)
+
+    def unescape(self, string: str) -> str:
+        return self._unescape(string)
+
+    def escape_many(self, strings: Iterable[str]) -> list[str]:
+        return list(map(self._escape, strings))
+
+    def unescape_many(self, strings: Iterable[str]) -> list[str]:
+        return list(map(self._unescape, strings))
+
+
+def _singlepass(escapetemplate: list[tuple[str, str]]) -> bool:
+    """Whether literal rules give the same result in one scan as in sequence."""
+    return all(map(_isliteral, escapetemplate)) and (
+        len(escapetemplate) < 2 or _independent(escapetemplate)
     )
 
+
+def _charmap(escapetemplate: list[tuple[str, str]]) -> bool:
+    """Whether the rules replace single ASCII characters with single ones."""
+    return _singlepass(escapetemplate) and all(
+        len(pattern) == len(replacement) == 1 and (pattern + replacement).isascii()
+        for pattern, replacement in escapetemplate
+    )
+
+
+class TranslateEscaper:
+    """Escaper replacing single characters with ``str.translate``.
+
+    Every escape rule must match one fixed character, and the rules must not
+    interact, as ``str.translate`` replaces them all in one pass. Unescape
+    rules may be any ``RegexEscaper`` rules, such as multi-character entities.
+
+    CPython only translates in its fast path when an ASCII string is mapped
+    character for character; other strings are escaped by the equivalent
+    ``RegexEscaper`` rules, which is faster for them.
+    """
+
+    def __init__(
+        self, escapes: list[tuple[str, str]], unescapes: list[tuple[str, str]]
+    ) -> None:
+        if not (
+            _singlepass(escapes) and all(len(pattern) == 1 for pattern, _ in escapes)
+        ):
+            raise ValueError(
+                "escape rules must each replace a single fixed character "
+                "and must not interact"
+            )
+        self._rules = (escapes, unescapes)
+        self._table = str.maketrans(dict(escapes))
+        self._translates = _charmap(escapes)
+        self._substitute = RegexEscaper._compilesubstitution(escapes)
+        self._unescape = RegexEscaper._compilesubstitution(unescapes)
+
+    def __reduce__(self) -> tuple[Any, ...]:
+        return type(self), self._rules
+
+    def escape(self, string: str) -> str:
+        if self._translates and string.isascii():
+            return string.translate(self._table)
+        return self._substitute(string)
+
+    def unescape(self, string: str) -> str:
+        return self._unescape(string)
+
+    def escape_many(self, strings: Iterable[str]) -> list[str]:
+        return list(map(self.escape, strings))
+
+    def unescape_many(self, strings: Iterable[str]) -> list[str]:
+        return list(map(self._unescape, strings))
+
+
+def make_escaper(
+    escapes: list[tuple[str, str]], unescapes: list[tuple[str, str]]
+) -> Escaper:
+    """Escaper for ``RegexEscaper`` rules using a single-pass engine if possible.
+
+    Escape rules mapping single ASCII characters to single characters are
+    promoted to a ``TranslateEscaper``. Otherwise rule sets without regex
+    metacharacters, and whose rules cannot interact, get a ``LiteralEscaper``;
+    anything else a ``RegexEscaper``.
+    """
+    if escapes and _charmap(escapes):
+        return TranslateEscaper(escapes, unescapes)
+    if _singlepass(escapes) and _singlepass(unescapes):
+        return LiteralEscaper(escapes, unescapes)
+    return RegexEscaper(escapes, unescapes)
+
+
+class NegNumberEscaper:
+    r"""Escaper for arguments starting with a negative number.
+
+    Prepends a backslash to arguments matching ``\A\\*-\d`` and strips it on
+    unescaping, like the equivalent ``RegexEscaper``, but decides with string
+    prefix checks. An argument starting with neither ``-`` nor ``\`` is
+    returned after a single comparison.
+    """
+
+    def escape(self, string: str) -> str:
+        if string[:1] in "-\\":
+            stripped = string.lstrip("\\")
+            if stripped[:1] == "-" and stripped[1:2].isdecimal():
+                return "\\" + string
+        return string
+
+    def unescape(self, string: str) -> str:
+        if string[:1] == "\\":
+            stripped = string.lstrip("\\")
+            if stripped[:1] == "-" and stripped[1:2].isdecimal():
+                return string[1:]
+        return string
+
+    # The batch methods inline the first-character test so that arguments
+    # which cannot need escaping never cost a method call.
+
+    def escape_many(self, strings: Iterable[str]) -> list[str]:
+        escape = self.escape
+        return [escape(s) if s[:1] in "-\\" else s for s in strings]
+
+    def unescape_many(self, strings: Iterable[str]) -> list[str]:
+        unescape = self.unescape
+        return [unescape(s) if s[:1] == "\\" else s for s in strings]
+
+
+class EscaperCacheInfo(NamedTuple):
+    hits: int
+    misses: int
+    evictions: int
+    maxsize: int
+    currsize: int
+
+
+class CachedEscaper:
+    """Escaper memoizing the results of another escaper.
+
+    Escaped and unescaped results are kept in separate LRU caches of at most
+    ``maxsize`` entries each, built on ``functools.lru_cache``, so an instance
+    can be shared between threads. Evictions are derived as misses that no
+    longer have an entry; concurrent misses on the same string may inflate
+    them slightly.
+    """
+
+    def __init__(self, escaper: StringEscaper, maxsize: int = 1024) -> None:
+        if maxsize < 0:
+            raise ValueError("maxsize must not be negative")
+        self.escaper = escaper
+        self.maxsize = maxsize
+        self._escape = lru_cache(maxsize)(escaper.escape)
+        self._unescape = lru_cache(maxsize)(escaper.unescape)
+
+    def __reduce__(self) -> tuple[Any, ...]:
+        # The cached results are left behind.
+        return type(self), (self.escaper, self.maxsize)
+
+    def escape(self, string: str) -> str:
+        return self._escape(string)
+
+    def unescape(self, string: str) -> str:
+        return self._unescape(string)
+
+    def escape_many(self, strings: Iterable[str]) -> list[str]:
+        return list(map(self._escape, strings))
+
+    def unescape_many(self, strings: Iterable[str]) -> list[str]:
+        return list(map(self._unescape, strings))
+
+    def cache_info(self) -> EscaperCacheInfo:
+        """Counters summed over the escape and unescape caches."""
+        hits = misses = currsize = 0
+        for info in (self._escape.cache_info(), self._unescape.cache_info()):
+            hits += info.hits
+            misses += info.misses
+            currsize += info.currsize
+        return EscaperCacheInfo(hits, misses, misses - currsize, self.maxsize, currsize)
+
+    def cache_clear(self) -> None:
+        self._escape.cache_clear()
+        self._unescape.cache_clear()
+
+
+# Escaped arguments of the parse running in the current context, keyed by
+# the id of the escaped string, mapped to the original argument.
+_manifest: ContextVar[Optional[dict[int, str]]] = ContextVar(
+    "negargparse_manifest", default=None
+)
+# Messages of a parse in the current context that are collected instead of
+# printed, and raised with a ParserExit instead of exiting.
+_output: ContextVar[Optional[list[str]]] = ContextVar(
+    "negargparse_output", default=None
+)
+
+# Manifest handed down to a nested parse of arguments that the running parse
+# has escaped already, by parse_known_intermixed_args or a subparsers action.
+_inherited: ContextVar[Optional[dict[int, str]]] = ContextVar(
+    "negargparse_inherited", default=None
+)
+
+
+def _producesstrings(action: argparse.Action) -> bool:
+    """Whether an action stores its argument strings as they are."""
+    return isinstance(action, (argparse._StoreAction, argparse._AppendAction)) and (
+        action.type is None or action.type is str
+    )
+
+
+def _restore(value: Any, manifest: dict[int, str]) -> Any:
+    """Replace escaped strings in a value, or in a (nested) list, by originals."""
+    get = manifest.get
+    if isinstance(value, list):
+        return [
+            _restore(item, manifest) if isinstance(item, list) else get(id(item), item)
+            for item in value
+        ]
+    return get(id(value), value)
+
+
+_ActionT = TypeVar("_ActionT", bound=argparse.Action)
+
+
+class _ArgumentGroup(argparse._ArgumentGroup):
+    """Argument group recording the actions that store plain strings.
+
+    The record is shared with the parser, like argparse shares the list of
+    actions between a parser and its groups, as every action is added through
+    one of the groups.
+    """
+
+    def __init__(self, container: Any, *args: Any, **kwargs: Any) -> None:
+        super().__init__(container, *args, **kwargs)
+        self._stringactions: dict[argparse.Action, None] = container._stringactions
+
+    def _add_action(self, action: _ActionT) -> _ActionT:
+        action = super()._add_action(action)
+        if _producesstrings(action):
+            self._stringactions[action] = None
+        return action
+
+    def _remove_action(self, action: argparse.Action) -> None:
+        super()._remove_action(action)
+        self._stringactions.pop(action, None)
+
+
+class EscapedArgv(List[str]):
+    """Arguments escaped by a NegativeArgumentParser, with their manifest.
+
+    ``parse_known_args`` takes these as they are and returns its extras as an
+    ``EscapedArgv`` too, so a chain of parsers escapes the arguments once.
+    """
+
+    def __init__(
+        self, args: Iterable[str] = (), manifest: Optional[dict[int, str]] = None
+    ) -> None:
+        super().__init__(args)
+        self.manifest: dict[int, str] = {} if manifest is None else manifest
+
+    def unescaped(self) -> list[str]:
+        """The original arguments."""
+        return _restore(list(self), self.manifest)
+
+    def __reduce__(self) -> tuple[Any, ...]:
+        # The manifest is keyed by id, so it is rebuilt from the originals.
+        return _rebuildargv, (list(self), self.unescaped())
+
+
+def _rebuildargv(args: list[str], originals: list[str]) -> EscapedArgv:
+    manifest = {
+        id(arg): original
+        for arg, original in zip(args, originals)
+        if arg is not original
+    }
+    return EscapedArgv(args, manifest)
+
+
+@lru_cache(maxsize=64)
+def _escapesoptions(escape: Callable[[str], str], options: tuple[str, ...]) -> bool:
+    """Whether escaping changes any of the option strings of a parser."""
+    return any(escape(option) != option for option in options)
+
+
+class _SubParsersAction(argparse._SubParsersAction):
+    """Subparsers action handing the escaped arguments down to the subparser."""
+
+    def __call__(
+        self,
+        parser: argparse.ArgumentParser,
+        namespace: argparse.Namespace,
+        values: Any,
+        option_string: Optional[str] = None,
+    ) -> None:
+        token = _inherited.set(_manifest.get())
+        try:
+            super().__call__(parser, namespace, values, option_string)
+        finally:
+            _inherited.reset(token)
+
+
+class ParserExit(Exception):
+    """A parse that ended with the parser exiting, e.g. on an error or -h.
+
+    ``status`` is the exit status and ``message`` everything the parser would
+    have printed.
+    """
+
+    def __init__(self, status: int, message: str) -> None:
+        super().__init__(status, message)
+        self.status = status
+        self.message = message
+
+
+class _ParseLock:
+    """Lets parses share a parser, except the ones that modify it.
+
+    The thread holding the lock exclusively may also take it shared, as
+    ``parse_known_intermixed_args`` calls ``parse_known_args``.
+    """
+
+    def __init__(self) -> None:
+        self._condition = _threading.Condition(_threading.Lock())
+        self._readers = 0
+        self._writer: Optional[int] = None
+
+    @contextmanager
+    def shared(self) -> Iterator[None]:
+        if self._writer == _threading.get_ident():
+            yield
+            return
+        with self._condition:
+            while self._writer is not None:
+                self._condition.wait()
+            self._readers += 1
+        try:
+            yield
+        finally:
+            with self._condition:
+                self._readers -= 1
+                if not self._readers:
+                    self._condition.notify_all()
+
+    @contextmanager
+    def exclusive(self) -> Iterator[None]:
+        with self._condition:
+            while self._writer is not None or self._readers:
+                self._condition.wait()
+            self._writer = _threading.get_ident()
+        try:
+            yield
+        finally:
+            with self._condition:
+                self._writer = None
+                self._condition.notify_all()
+
+
+class NegativeArgumentParser(argparse.ArgumentParser):
+    """ArgumentParser accepting arguments that look like negative numbers.
+
+    With ``autounescape`` (the default), arguments stored as plain strings and
+    the unrecognized arguments come back as given, without declaring their
+    type as ``NegString``.
+    """
+
+    negargescaper: Escaper = NegNumberEscaper()
+
+    def __init__(self, *args: Any, autounescape: bool = True, **kwargs: Any) -> None:
+        self.autounescape = autounescape
+        self._lock = _ParseLock()
+        # Actions storing plain strings, in order, filled in by the groups.
+        self._stringactions: dict[argparse.Action, None] = {}
+        super().__init__(*args, **kwargs)
+        self.register("action", "parsers", _SubParsersAction)
+        # argparse registers a local function, which cannot be pickled.
+        self.register("type", None, _identity)
+
+    def __getstate__(self) -> dict[str, Any]:
+        state = self.__dict__.copy()
+        del state["_lock"]
+        return state
+
+    def __setstate__(self, state: dict[str, Any]) -> None:
+        self.__dict__.update(state)
+        self._lock = _ParseLock()
+
+    def add_argument_group(self, *args: Any, **kwargs: Any) -> argparse._ArgumentGroup:
+        group = _ArgumentGroup(self, *args, **kwargs)
+        self._action_groups.append(group)
+        return group
+
     def parse_known_args(
         self,
         args: Sequence[str] = None,
@@ -98,8 +749,244 @@ def parse_known_args(
         if args is None:
             # args default to the system args
             args = _sys.argv[1:]
-        args = [self.negargescaper.escape(arg) for arg in args]
-        return super().parse_known_args(args, namespace)
+        with self._lock.shared():
+            return self._parseknownargs(args, namespace)
+
+    def _parseknownargs(
+        self, args: Sequence[str], namespace: argparse.Namespace
+    ) -> tuple[argparse.Namespace, list[str]]:
+        inherited = _inherited.get()
+        if inherited is None:
+            escaped, manifest = self._prepareargs(args)
+        else:
+            # Escaped by the calling parse, which also restores the extras.
+            escaped, manifest = args, inherited
+        token = _manifest.set(manifest)
+        inheritedtoken = _inherited.set(None)
+        try:
+            namespace, extras = super().parse_known_args(escaped, namespace)
+        finally:
+            _inherited.reset(inheritedtoken)
+            _manifest.reset(token)
+        if manifest and self.autounescape:
+            self._unescapenamespace(namespace, manifest)
+        if isinstance(args, EscapedArgv):
+            return namespace, EscapedArgv(extras, manifest)
+        if manifest and self.autounescape and inherited is None:
+            extras = _restore(extras, manifest)
+        return namespace, extras
+
+    def parse_known_intermixed_args(
+        self,
+        args: Sequence[str] = None,
+        namespace: argparse.Namespace = None,
+    ) -> tuple[argparse.Namespace, list[str]]:
+        # argparse calls parse_known_args twice, the second time on the extras
+        # of the first, so the arguments are escaped once here for both.
+        if args is None:
+            # args default to the system args
+            args = _sys.argv[1:]
+        escaped, manifest = self._prepareargs(args)
+        token = _inherited.set(manifest)
+        try:
+            # argparse changes the positionals for the duration of the parse.
+            with self._lock.exclusive():
+                namespace, extras = super().parse_known_intermixed_args(
+                    escaped, namespace
+                )
+        finally:
+            _inherited.reset(token)
+        if isinstance(args, EscapedArgv):
+            return namespace, EscapedArgv(extras, manifest)
+        if manifest and self.autounescape:
+            extras = _restore(extras, manifest)
+        return namespace, extras
+
+    def parse_many(
+        self,
+        argvs: Iterable[Union[str, Sequence[str]]],
+        workers: Optional[int] = None,
+    ) -> list[Union[argparse.Namespace, ParserExit]]:
+        """Parse several command lines with ``parse_args`` on a thread pool.
+
+        A command line is a list of arguments, or a line that is split like a
+        shell would. The results come in the order of ``argvs``. A parse that
+        would exit gives a ParserExit with its status and output instead,
+        nothing is printed. Other exceptions are raised.
+        """
+        with ThreadPoolExecutor(max_workers=workers) as executor:
+            return list(executor.map(self._parsecaptured, argvs))
+
+    def parse_bulk(
+        self,
+        argvs: Iterable[Union[str, Sequence[str]]],
+        processes: Optional[int] = None,
+        chunksize: int = 256,
+    ) -> Iterator[Union[argparse.Namespace, ParserExit]]:
+        """Parse command lines like ``parse_many``, on a pool of processes.
+
+        The parser is sent to each worker process once and the command lines
+        in chunks of ``chunksize``. Only a few chunks per process are in
+        flight at any time, so ``argvs`` may be a stream of any length, and
+        the results are yielded in order as they come in.
+        """
+        if chunksize < 1:
+            raise ValueError("chunksize must be positive")
+        if processes is None:
+            processes = _os.cpu_count() or 1
+        commands = iter(argvs)
+        pending: deque[Any] = deque()
+        with _multiprocessing.Pool(processes, _initbulkworker, (self,)) as pool:
+            for chunk in iter(lambda: list(islice(commands, chunksize)), []):
+                pending.append(pool.apply_async(_parsebulkchunk, (chunk,)))
+                if len(pending) > 2 * processes:
+                    yield from pending.popleft().get()
+            while pending:
+                yield from pending.popleft().get()
+
+    def _parsecaptured(
+        self, args: Union[str, Sequence[str]]
+    ) -> Union[argparse.Namespace, ParserExit]:
+        token = _output.set([])
+        try:
+            if isinstance(args, str):
+                try:
+                    args = _shlex.split(args)
+                except ValueError as error:
+                    self.error(str(error))
+            return self.parse_args(args)
+        except ParserExit as exit:
+            return exit
+        finally:
+            _output.reset(token)
+
+    def _print_message(self, message: str, file: Any = None) -> None:
+        output = _output.get()
+        if output is None:
+            super()._print_message(message, file)
+        elif message:
+            output.append(message)
+
+    def exit(self, status: int = 0, message: Optional[str] = None) -> NoReturn:
+        output = _output.get()
+        if output is None:
+            super().exit(status, message)
+        if message:
+            output.append(message)
+        raise ParserExit(status, "".join(output))
+
+    def escape_args(self, args: Sequence[str] = None) -> EscapedArgv:
+        """Escape arguments for one or more calls to ``parse_known_args``.
+
+        Registered options that look like negative numbers are left as they
+        are, like in a parse by this parser.
+        """
+        if args is None:
+            # args default to the system args
+            args = _sys.argv[1:]
+        escaped, manifest = self._escapeargs(args)
+        return EscapedArgv(escaped, manifest)
+
+    def _prepareargs(self, args: Sequence[str]) -> tuple[Sequence[str], dict[int, str]]:
+        """Escaped arguments and their manifest, for arguments of any kind."""
+        if not isinstance(args, EscapedArgv):
+            return self._escapeargs(args)
+        # Options of this parser may have been escaped by another parser.
+        options = tuple(self._option_string_actions)
+        if not _escapesoptions(self.negargescaper.escape, options):
+            return args, args.manifest
+        manifest = args.manifest
+        isoption = self._isoption
+        return [
+            manifest[id(arg)]
+            if id(arg) in manifest and isoption(manifest[id(arg)])
+            else arg
+            for arg in args
+        ], manifest
+
+    def _unescapenamespace(
+        self, namespace: argparse.Namespace, manifest: dict[int, str]
+    ) -> None:
+        """Put back the original of escaped strings stored by plain actions.
+
+        Only the destinations of actions recorded when they were added are
+        visited, each string is a single lookup in the manifest.
+        """
+        for action in self._stringactions:
+            value = getattr(namespace, action.dest, None)
+            if value is not None:
+                setattr(namespace, action.dest, _restore(value, manifest))
+
+    def _escapeargs(self, args: Sequence[str]) -> tuple[Sequence[str], dict[int, str]]:
+        """Escape arguments, copying them only once one actually changes.
+
+        Escaping stops at the first ``--``; argparse takes everything after it
+        as positional, so the tail is passed through untouched. Returns the
+        escaped arguments, which are ``args`` itself if nothing needed
+        escaping, and the manifest of escaped strings. The escaped strings
+        stay alive in the returned list for the whole parse, so their ids
+        cannot be reused by other strings meanwhile.
+        """
+        try:
+            end = args.index("--")
+        except ValueError:
+            end = len(args)
+        escape = self.negargescaper.escape
+        isoption = self._isoption
+        for start, arg in enumerate(islice(args, end)):
+            new = escape(arg)
+            if new is not arg and new != arg and not isoption(arg):
+                break
+        else:
+            return args, {}
+        escaped = list(args)
+        escaped[start] = new
+        manifest = {id(new): arg}
+        for index in range(start + 1, end):
+            arg = escaped[index]
+            new = escape(arg)
+            if new is not arg and new != arg and not isoption(arg):
+                escaped[index] = new
+                manifest[id(new)] = arg
+        return escaped, manifest
+
+    def _isoption(self, arg: str) -> bool:
+        """Whether an argument names a registered option, like ``-1`` or ``-1=x``.
+
+        ``_option_string_actions`` is kept current by ``add_argument``, argument
+        groups and conflict resolution, so this is a hash lookup on the token.
+        """
+        options = self._option_string_actions
+        return arg in options or ("=" in arg and arg.split("=", 1)[0] in options)
+
+
+def _identity(string: str) -> str:
+    return string
+
+
+# Parser of a parse_bulk worker process, set when the process starts.
+_bulkparser: Optional[NegativeArgumentParser] = None
+
+
+def _initbulkworker(parser: NegativeArgumentParser) -> None:
+    global _bulkparser
+    _bulkparser = parser
+
+
+def _parsebulkchunk(
+    chunk: list[Union[str, Sequence[str]]]
+) -> list[Union[argparse.Namespace, ParserExit]]:
+    if _bulkparser is None:
+        raise RuntimeError("not in a parse_bulk worker process")
+    return list(map(_bulkparser._parsecaptured, chunk))
+
+
+def _unescape(arg: str) -> str:
+    """Original of an argument, looked up in the current parse if possible."""
+    manifest = _manifest.get()
+    if manifest is None:
+        return NegativeArgumentParser.negargescaper.unescape(arg)
+    return manifest.get(id(arg), arg)
 
 
 # Not explicitly checking for type of arg as it is only supposed
@@ -108,17 +995,14 @@ def parse_known_args(
 
 class NegInt(int):
     def __new__(cls: Type[NegInt], arg: str) -> NegInt:
-        arg = NegativeArgumentParser.negargescaper.unescape(arg)
-        return super().__new__(cls, arg)
+        return super().__new__(cls, _unescape(arg))
 
 
 class NegFloat(float):
     def __new__(cls: Type[NegFloat], arg: str) -> NegFloat:
-        arg = NegativeArgumentParser.negargescaper.unescape(arg)
-        return super().__new__(cls, arg)
+        return super().__new__(cls, _unescape(arg))
 
 
 class NegString(str):
     def __new__(cls: Type[NegString], arg: str) -> NegString:
-        arg = NegativeArgumentParser.negargescaper.unescape(arg)
-        return super().__new__(cls, arg)
+        return super().__new__(cls, _unescape(arg))
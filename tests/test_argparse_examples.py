@@ -1038,12 +1038,10 @@ def negarg_parser_1_NAP():
     return parser
 
 
-@pytest.mark.xfail(reason="intended")
 def example_negarg_1_NAP(negarg_parser_1_NAP):
     assert negarg_parser_1_NAP.parse_args(["-x", "-1"]) == Namespace(foo=None, x="-1")
 
 
-@pytest.mark.xfail(reason="intended")
 def example_negarg_2_NAP(negarg_parser_1_NAP):
     assert negarg_parser_1_NAP.parse_args(["-x", "-1", "-5"]) == Namespace(
         foo="-5", x="-1"
@@ -1058,7 +1056,6 @@ def negarg_parser_2_NAP():
     return parser
 
 
-@pytest.mark.xfail(reason="intended")
 def example_negarg_3_NAP(negarg_parser_2_NAP):
     assert negarg_parser_2_NAP.parse_args(["-1", "X"]) == Namespace(foo=None, one="X")
 
@@ -1075,7 +1072,6 @@ def example_negarg_4_NAP(negarg_parser_2_NAP, capsys):
     )
 
 
-@pytest.mark.xfail(reason="intended")
 def example_negarg_5_NAP(negarg_parser_2_NAP, capsys):
     with pytest.raises(SystemExit):
         negarg_parser_2_NAP.parse_args(["-1", "-1"])
@@ -1,3 +1,7 @@
+import pickle
+import random
+import re
+from concurrent.futures import ThreadPoolExecutor
 import pytest
 from negargparse import negargparse
 
@@ -44,6 +48,12 @@ def test_HTML_escaper(HTMLescaper, raw, escaped):
     assert HTMLescaper.unescape(escaped) == raw
 
 
+NEGNUMBER_REGEX = negargparse.RegexEscaper(
+    [(r"\A(\\*-\d)", r"\\\1")],
+    [(r"\A\\(\\*-\d)", r"\1")],
+)
+
+
 @pytest.mark.parametrize(
     "raw, escaped",
     [
@@ -63,3 +73,226 @@ def test_negargescaper(raw, escaped):
     escaper = negargparse.NegativeArgumentParser.negargescaper
     assert escaper.escape(raw) == escaped
     assert escaper.unescape(escaped) == raw
+    assert NEGNUMBER_REGEX.escape(raw) == escaped
+    assert NEGNUMBER_REGEX.unescape(escaped) == raw
+
+
+@pytest.mark.parametrize("seed", range(5))
+def test_negnumberescaper_matches_regex(seed):
+    escaper = negargparse.NegNumberEscaper()
+    rng = random.Random(seed)
+    # Arabic-indic three is a decimal digit to \d, superscript two is not.
+    alphabet = "\\\\--019a \n\u0663\u00b2"
+    for _ in range(2000):
+        string = "".join(rng.choice(alphabet) for _ in range(rng.randrange(8)))
+        assert escaper.escape(string) == NEGNUMBER_REGEX.escape(string)
+        assert escaper.unescape(string) == NEGNUMBER_REGEX.unescape(string)
+
+
+@pytest.mark.parametrize(
+    "escapes",
+    [
+        pytest.param([("a", "b"), ("b", "c")], id="rematch_replacement"),
+        pytest.param([("bc", "1"), ("ab", "2")], id="overlapping_patterns"),
+        pytest.param([("x", ""), ("ab", "_")], id="join_after_removal"),
+        pytest.param([("a", "xy"), ("yb", "_")], id="replacement_prefix"),
+        pytest.param([("a", "1"), ("b", "2"), ("c", "3")], id="independent"),
+        pytest.param([("a+", "A"), ("b", "a")], id="regex"),
+    ],
+)
+def test_single_pass_matches_sequential(escapes):
+    escaper = negargparse.RegexEscaper(escapes, [])
+    rng = random.Random(repr(escapes))
+    for _ in range(200):
+        string = "".join(rng.choice("abcxy") for _ in range(rng.randrange(12)))
+        expected = escaper._substitute(string, escaper.escapes)
+        assert escaper.escape(string) == expected
+
+
+def test_HTML_escaper_single_pass_matches_sequential(HTMLescaper):
+    rng = random.Random(0)
+    alphabet = "&<>\"';#x27ampltgquot "
+    for _ in range(500):
+        string = "".join(rng.choice(alphabet) for _ in range(rng.randrange(40)))
+        escaped = HTMLescaper._substitute(string, HTMLescaper.escapes)
+        assert HTMLescaper.escape(string) == escaped
+        unescaped = HTMLescaper._substitute(string, HTMLescaper.unescapes)
+        assert HTMLescaper.unescape(string) == unescaped
+
+
+class UpperEscaper:
+    def escape(self, string):
+        return string.upper()
+
+    def unescape(self, string):
+        return string.lower()
+
+
+@pytest.mark.parametrize(
+    "escaper",
+    [
+        pytest.param(negargparse.NegNumberEscaper(), id="negnumber"),
+        pytest.param(NEGNUMBER_REGEX, id="regex"),
+        pytest.param(negargparse.BatchEscaper(NEGNUMBER_REGEX), id="adapter"),
+    ],
+)
+def test_escape_many(escaper):
+    strings = ["argument", "-2", r"\-1", r"\\\\-4", "-o", "", "\\"]
+    assert escaper.escape_many(strings) == [escaper.escape(s) for s in strings]
+    assert escaper.escape_many(iter(strings)) == [escaper.escape(s) for s in strings]
+    escaped = escaper.escape_many(strings)
+    assert escaper.unescape_many(escaped) == strings
+
+
+def test_batch_adapter_as_negargescaper(monkeypatch):
+    escaper = negargparse.BatchEscaper(UpperEscaper())
+    monkeypatch.setattr(negargparse.NegativeArgumentParser, "negargescaper", escaper)
+    parser = negargparse.NegativeArgumentParser()
+    parser.add_argument("foo", type=negargparse.NegString)
+    assert parser.parse_args(["bar"]).foo == "bar"
+
+
+def test_cached_escaper_counters(HTMLescaper):
+    escaper = negargparse.CachedEscaper(HTMLescaper, maxsize=2)
+    assert escaper.escape("<a>") == "&lt;a&gt;"
+    assert escaper.escape("<a>") == "&lt;a&gt;"
+    assert escaper.unescape("&lt;a&gt;") == "<a>"
+    assert escaper.cache_info() == negargparse.EscaperCacheInfo(1, 2, 0, 2, 2)
+    escaper.escape_many(["1", "2", "<a>"])
+    assert escaper.cache_info() == negargparse.EscaperCacheInfo(1, 5, 2, 2, 3)
+
+
+def test_cached_escaper_bounded():
+    escaper = negargparse.CachedEscaper(negargparse.NegNumberEscaper(), maxsize=16)
+    paths = [f"/data/{i}" for i in range(1000)]
+    assert escaper.escape_many(paths) == paths
+    info = escaper.cache_info()
+    assert info.currsize == 16
+    assert info.evictions == 1000 - 16
+
+
+def test_cached_escaper_threads():
+    escaper = negargparse.CachedEscaper(NEGNUMBER_REGEX, maxsize=8)
+    strings = [f"-{i % 20}" for i in range(2000)]
+    with ThreadPoolExecutor(8) as pool:
+        results = list(pool.map(escaper.escape, strings))
+    assert results == [NEGNUMBER_REGEX.escape(s) for s in strings]
+    assert escaper.cache_info().currsize <= 8
+
+
+def test_cached_escaper_as_negargescaper(monkeypatch):
+    escaper = negargparse.CachedEscaper(negargparse.NegNumberEscaper())
+    monkeypatch.setattr(negargparse.NegativeArgumentParser, "negargescaper", escaper)
+    parser = negargparse.NegativeArgumentParser()
+    parser.add_argument("x", type=negargparse.NegInt)
+    assert parser.parse_args(["-1"]).x == -1
+    assert parser.parse_args(["-1"]).x == -1
+    # Converters look escaped arguments up in the parse instead of unescaping.
+    assert escaper.cache_info()[:2] == (1, 1)
+
+
+HTML_RULES = (
+    [("&", "&amp;"), ("<", "&lt;"), (">", "&gt;"), ('"', "&quot;"), ("'", "&#x27;")],
+    [("&#x27;", "'"), ("&quot;", '"'), ("&gt;", ">"), ("&lt;", "<"), ("&amp;", "&")],
+)
+
+
+def test_make_escaper_literal(HTMLescaper):
+    escaper = negargparse.make_escaper(*HTML_RULES)
+    assert isinstance(escaper, negargparse.LiteralEscaper)
+    rng = random.Random(0)
+    alphabet = "&<>\"';#x27ampltgquot "
+    for _ in range(500):
+        string = "".join(rng.choice(alphabet) for _ in range(rng.randrange(40)))
+        assert escaper.escape(string) == HTMLescaper.escape(string)
+        assert escaper.unescape(string) == HTMLescaper.unescape(string)
+
+
+@pytest.mark.parametrize(
+    "escapes",
+    [
+        pytest.param([(r"\A(\\*-\d)", r"\\\1")], id="regex"),
+        pytest.param([("a", "b"), ("b", "c")], id="interacting"),
+        pytest.param([("a", r"\\")], id="template"),
+    ],
+)
+def test_make_escaper_regex(escapes):
+    escaper = negargparse.make_escaper(escapes, [])
+    assert isinstance(escaper, negargparse.RegexEscaper)
+
+
+@pytest.mark.parametrize("seed", range(5))
+def test_literal_escaper_leftmost_first(seed):
+    # Matches the leftmost-first semantics of a regex alternation, even
+    # where that differs from applying the rules in sequence.
+    rng = random.Random(seed)
+    for _ in range(200):
+        patterns = list(
+            {
+                "".join(rng.choice("abc") for _ in range(rng.randint(1, 4)))
+                for _ in range(rng.randint(1, 5))
+            }
+        )
+        rules = [(pattern, str(i)) for i, pattern in enumerate(patterns)]
+        escaper = negargparse.LiteralEscaper(rules, [])
+        alternation = re.compile("|".join(patterns))
+        replacements = dict(rules)
+        for _ in range(20):
+            string = "".join(rng.choice("abcd") for _ in range(rng.randrange(15)))
+            expected = alternation.sub(lambda m: replacements[m[0]], string)
+            assert escaper.escape(string) == expected
+
+
+def test_literal_escaper_empty_pattern():
+    with pytest.raises(ValueError):
+        negargparse.LiteralEscaper([("", "x")], [])
+
+
+def test_translate_escaper_HTML(HTMLescaper):
+    escaper = negargparse.TranslateEscaper(*HTML_RULES)
+    rng = random.Random(0)
+    alphabet = "&<>\"';#x27ampltgquot é"
+    for _ in range(500):
+        string = "".join(rng.choice(alphabet) for _ in range(rng.randrange(40)))
+        assert escaper.escape(string) == HTMLescaper.escape(string)
+        assert escaper.unescape(string) == HTMLescaper.unescape(string)
+
+
+@pytest.mark.parametrize("string", ["a-b=c", "a-b=cé", "", "---"])
+def test_translate_escaper_charmap(string):
+    rules = ([("-", "_"), ("=", ":")], [("_", "-"), (":", "=")])
+    escaper = negargparse.make_escaper(*rules)
+    assert isinstance(escaper, negargparse.TranslateEscaper)
+    reference = negargparse.RegexEscaper(*rules)
+    assert escaper.escape(string) == reference.escape(string)
+    assert escaper.escape_many([string]) == [reference.escape(string)]
+
+
+@pytest.mark.parametrize(
+    "escapes",
+    [
+        pytest.param([("ab", "c")], id="multichar"),
+        pytest.param([("a", "b"), ("b", "c")], id="interacting"),
+        pytest.param([(".", "b")], id="regex"),
+    ],
+)
+def test_translate_escaper_invalid(escapes):
+    with pytest.raises(ValueError):
+        negargparse.TranslateEscaper(escapes, [])
+
+
+@pytest.mark.parametrize(
+    "escaper",
+    [
+        negargparse.RegexEscaper(*HTML_RULES),
+        negargparse.LiteralEscaper(*HTML_RULES),
+        negargparse.TranslateEscaper(*HTML_RULES),
+        negargparse.CachedEscaper(negargparse.LiteralEscaper(*HTML_RULES), 16),
+    ],
+)
+def test_pickle_escaper(escaper):
+    restored = pickle.loads(pickle.dumps(escaper))
+    assert type(restored) is type(escaper)
+    raw = "<a href='x'>&amp;</a>"
+    assert restored.escape(raw) == escaper.escape(raw)
+    assert restored.unescape(escaper.escape(raw)) == raw
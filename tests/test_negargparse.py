@@ -1,6 +1,9 @@
 from textwrap import dedent
+import pickle
 import pytest
+from concurrent.futures import ThreadPoolExecutor
 from argparse import Namespace
+from negargparse import negargparse
 from negargparse.negargparse import NegativeArgumentParser, NegInt, NegFloat, NegString
 
 
@@ -49,7 +52,6 @@ def test_example_negarg_1_NAP_revised():
     assert parser.parse_args(["-x", "-1"]) == Namespace(foo=None, x="-1")
 
 
-@pytest.mark.xfail(reason="possible feature")
 def test_example_negarg_2_NAP_revised_autonegstring():
     parser = NegativeArgumentParser(prog="PROG")
     parser.add_argument("-x")
@@ -74,14 +76,13 @@ def test_example_negarg_4_NAP_revised():
     parser.parse_args(["-2"]) == Namespace(foo="-2", one=None)
 
 
-@pytest.mark.xfail(reason="possible feature")
-def test_example_negarg_5_NAP_revised(negarg_parser_2_NAP, capsys):
+def test_example_negarg_5_NAP_revised(capsys):
     parser = NegativeArgumentParser(prog="PROG")
     parser.add_argument("-1", dest="one", type=NegString)
     parser.add_argument("foo", nargs="?", type=NegString)
 
     with pytest.raises(SystemExit):
-        negarg_parser_2_NAP.parse_args(["-1", "-1"])
+        parser.parse_args(["-1", "-1"])
     assert capsys.readouterr().err == dedent(
         """\
         usage: PROG [-h] [-1 ONE] [foo]
@@ -99,11 +100,7 @@ def test_example_negarg_5_NAP_revised(negarg_parser_2_NAP, capsys):
         (["-x", "2"], Namespace(foo=None, x=2)),
         (["-x", "-2"], Namespace(foo=None, x=-2)),
         (["5"], Namespace(foo="5", x=None)),
-        pytest.param(
-            ["-5"],
-            Namespace(foo="-5", x=None),
-            marks=pytest.mark.xfail(reason="possible feature"),
-        ),
+        (["-5"], Namespace(foo="-5", x=None)),
         pytest.param(
             ["-x", "hello"],
             Namespace(foo=None, x="hello"),
@@ -154,7 +151,6 @@ def test_wcs(args, result):
     assert parser.parse_args(args) == result
 
 
-@pytest.mark.xfail(reason="possible feature")
 def test_pseudo_argument():
     parser = NegativeArgumentParser()
     parser.add_argument("x")
@@ -165,3 +161,279 @@ def test_pseudo_argument_revised():
     parser = NegativeArgumentParser()
     parser.add_argument("x", type=NegString)
     assert parser.parse_args(["--", "-1"]) == Namespace(x="-1")
+
+
+class CountingEscaper(negargparse.NegNumberEscaper):
+    def __init__(self):
+        self.escaped = 0
+        self.unescaped = 0
+
+    def escape(self, string):
+        self.escaped += 1
+        return super().escape(string)
+
+    def unescape(self, string):
+        self.unescaped += 1
+        return super().unescape(string)
+
+
+def test_manifest_skips_unescape(monkeypatch):
+    escaper = CountingEscaper()
+    monkeypatch.setattr(NegativeArgumentParser, "negargescaper", escaper)
+    parser = NegativeArgumentParser()
+    parser.add_argument("n", type=NegInt, nargs="+")
+    parser.add_argument("-s", type=NegString)
+    assert parser.parse_args(["-s", "\\-1", "1", "-2", "-3"]) == Namespace(
+        n=[1, -2, -3], s="\\-1"
+    )
+    assert escaper.unescaped == 0
+
+
+def test_manifest_outside_parse():
+    assert NegInt("\\-3") == -3
+    assert NegString("\\-3") == "-3"
+
+
+def test_manifest_literal_backslash():
+    # Only arguments escaped by the parser are unescaped.
+    parser = NegativeArgumentParser()
+    parser.add_argument("x", type=NegString)
+    parser.add_argument("y", type=NegString)
+    assert parser.parse_args(["--", "\\-1", "-1"]) == Namespace(x="\\-1", y="-1")
+
+
+def test_escapeargs_copy_on_write():
+    parser = NegativeArgumentParser()
+    args = ["a", "-o", "b"]
+    assert parser._escapeargs(args) == (args, {})
+    assert parser._escapeargs(args)[0] is args
+    args = ["a", "-1", "b", "-2"]
+    escaped, manifest = parser._escapeargs(args)
+    assert escaped == ["a", "\\-1", "b", "\\-2"]
+    assert args == ["a", "-1", "b", "-2"]
+    assert sorted(manifest.values()) == ["-1", "-2"]
+
+
+@pytest.mark.parametrize(
+    "args, result",
+    [
+        (["-1", "-2"], Namespace(one=-2, foo=None)),
+        (["-1=-2", "-3"], Namespace(one=-2, foo=-3)),
+        (["-12"], Namespace(one=None, foo=-12)),
+        (["--", "-1"], Namespace(one=None, foo=-1)),
+    ],
+)
+def test_numeric_option(args, result):
+    parser = NegativeArgumentParser()
+    group = parser.add_argument_group("numeric")
+    group.add_argument("-1", dest="one", type=NegInt)
+    parser.add_argument("foo", nargs="?", type=NegInt)
+    assert parser.parse_args(args) == result
+
+
+def test_numeric_option_resolved():
+    parser = NegativeArgumentParser(conflict_handler="resolve")
+    parser.add_argument("-1", "--one", dest="one")
+    parser.add_argument("--one", dest="other")
+    parser.add_argument("foo", nargs="?", type=NegInt)
+    assert parser.parse_args(["-1", "x"]) == Namespace(one="x", other=None, foo=None)
+
+
+def test_pseudo_argument_tail_untouched():
+    parser = NegativeArgumentParser()
+    parser.add_argument("-x", type=NegInt)
+    parser.add_argument("rest", nargs="*")
+    args = ["-x", "-1", "--", "-2", "\\-3", "--", "-4"]
+    escaped, manifest = parser._escapeargs(args)
+    assert escaped[3:] == args[3:]
+    assert all(new is old for new, old in zip(escaped[3:], args[3:]))
+    assert list(manifest.values()) == ["-1"]
+    assert parser.parse_args(args) == Namespace(x=-1, rest=["-2", "\\-3", "--", "-4"])
+
+
+def test_autounescape():
+    parser = NegativeArgumentParser()
+    group = parser.add_mutually_exclusive_group()
+    group.add_argument("-x")
+    parser.add_argument("-a", action="append", nargs=2, type=str)
+    parser.add_argument("-n", type=NegInt)
+    parser.add_argument("rest", nargs="*")
+    args = ["-x", "-1", "-a", "-2", "b", "-a", "c", "-3", "-n", "-4", "-5", "-6"]
+    assert parser.parse_known_args(args + ["-z", "-7"]) == (
+        Namespace(x="-1", a=[["-2", "b"], ["c", "-3"]], n=-4, rest=["-5", "-6"]),
+        ["-z", "-7"],
+    )
+    assert list(parser._stringactions) == [
+        action for action in parser._actions if action.dest in ("x", "a", "rest")
+    ]
+
+
+def test_autounescape_disabled():
+    parser = NegativeArgumentParser(autounescape=False)
+    parser.add_argument("foo")
+    parser.add_argument("bar", type=NegString)
+    assert parser.parse_args(["-1", "-2"]) == Namespace(foo="\\-1", bar="-2")
+
+
+def test_autounescape_resolved():
+    parser = NegativeArgumentParser(conflict_handler="resolve")
+    parser.add_argument("-x")
+    parser.add_argument("-x", type=NegInt)
+    assert not parser._stringactions
+    assert parser.parse_args(["-x", "-1"]) == Namespace(x=-1)
+
+
+@pytest.mark.parametrize(
+    "autounescape, rest", [(True, ["a", "-1", "-3"]), (False, ["a", "\\-1", "\\-3"])]
+)
+def test_intermixed_escapes_once(monkeypatch, autounescape, rest):
+    escaper = CountingEscaper()
+    monkeypatch.setattr(NegativeArgumentParser, "negargescaper", escaper)
+    parser = NegativeArgumentParser(autounescape=autounescape)
+    parser.add_argument("-x", type=NegInt)
+    parser.add_argument("rest", nargs="*")
+    args = ["a", "-1", "-x", "-2", "-3"]
+    assert parser.parse_intermixed_args(args) == Namespace(x=-2, rest=rest)
+    assert escaper.escaped == len(args)
+
+
+def test_intermixed_extras():
+    parser = NegativeArgumentParser()
+    parser.add_argument("-x")
+    parser.add_argument("foo")
+    assert parser.parse_known_intermixed_args(["-1", "-x", "-2", "-3"]) == (
+        Namespace(x="-2", foo="-1"),
+        ["-3"],
+    )
+
+
+@pytest.mark.parametrize("autounescape, foo", [(True, "-1"), (False, "\\-1")])
+def test_subparser_escapes_once(monkeypatch, autounescape, foo):
+    escaper = CountingEscaper()
+    monkeypatch.setattr(NegativeArgumentParser, "negargescaper", escaper)
+    parser = NegativeArgumentParser(autounescape=autounescape)
+    subparsers = parser.add_subparsers(dest="command")
+    sub = subparsers.add_parser("sub", autounescape=autounescape)
+    sub.add_argument("foo")
+    sub.add_argument("-n", type=NegInt)
+    args = ["sub", "-1", "-n", "-2", "-3"]
+    assert parser.parse_known_args(args) == (
+        Namespace(command="sub", foo=foo, n=-2),
+        ["-3" if autounescape else "\\-3"],
+    )
+    assert escaper.escaped == len(args)
+
+
+def test_escaped_argv_chain(monkeypatch):
+    escaper = CountingEscaper()
+    monkeypatch.setattr(NegativeArgumentParser, "negargescaper", escaper)
+    args = ["--config", "-1", "-a", "-2", "-b", "-3", "-c", "-4", "-d", "-5", "-6"]
+    bootstrap = NegativeArgumentParser()
+    bootstrap.add_argument("--config")
+    plugins = []
+    for option in "abcd":
+        plugins.append(NegativeArgumentParser())
+        plugins[-1].add_argument(f"-{option}", type=NegInt)
+    for _ in range(2):
+        # Only the first run checks whether the parsers' options need escaping.
+        escaper.escaped = 0
+        rest = bootstrap.escape_args(args)
+        namespace, rest = bootstrap.parse_known_args(rest)
+        assert namespace == Namespace(config="-1")
+        for plugin, option, value in zip(plugins, "abcd", (-2, -3, -4, -5)):
+            namespace, rest = plugin.parse_known_args(rest)
+            assert vars(namespace) == {option: value}
+            assert isinstance(rest, negargparse.EscapedArgv)
+    assert escaper.escaped == len(args)
+    assert rest == ["\\-6"]
+    assert rest.unescaped() == ["-6"]
+
+
+def test_escaped_argv_numeric_option():
+    rest = NegativeArgumentParser().escape_args(["-1", "-2", "-1=-3"])
+    parser = NegativeArgumentParser()
+    parser.add_argument("-1", dest="one", action="append", type=NegInt)
+    assert parser.parse_known_args(rest) == (Namespace(one=[-2, -3]), [])
+
+
+def test_escaped_argv_intermixed():
+    parser = NegativeArgumentParser()
+    parser.add_argument("-x")
+    parser.add_argument("foo")
+    namespace, rest = parser.parse_known_intermixed_args(
+        parser.escape_args(["-1", "-x", "-2", "-3"])
+    )
+    assert namespace == Namespace(x="-2", foo="-1")
+    assert rest.unescaped() == ["-3"]
+
+
+def test_escaped_argv_pickle():
+    argv = NegativeArgumentParser().escape_args(["a", "-1", "-1"])
+    restored = pickle.loads(pickle.dumps(argv))
+    assert restored == argv
+    assert restored.unescaped() == ["a", "-1", "-1"]
+
+
+def test_parse_many(capsys):
+    parser = NegativeArgumentParser(prog="PROG")
+    parser.add_argument("-x", type=NegInt)
+    parser.add_argument("foo")
+    results = parser.parse_many(
+        [["-1", "-x", "-2"], ["-x", "a", "b"], ["-h"], ["-3"]], workers=2
+    )
+    assert results[0] == Namespace(x=-2, foo="-1")
+    assert isinstance(results[1], negargparse.ParserExit)
+    assert results[1].status == 2
+    assert results[1].message == dedent(
+        """\
+        usage: PROG [-h] [-x X] foo
+        PROG: error: argument -x: invalid NegInt value: 'a'
+        """
+    )
+    assert results[2].status == 0
+    assert results[2].message.startswith("usage: PROG [-h] [-x X] foo\n")
+    assert results[3] == Namespace(x=None, foo="-3")
+    assert capsys.readouterr() == ("", "")
+
+
+def test_concurrent_parse():
+    parser = NegativeArgumentParser()
+    parser.add_argument("-x", type=NegInt)
+    parser.add_argument("foo")
+    parser.add_argument("bar", nargs="?")
+
+    def parse(value):
+        args = [str(-value), str(value), "-x", str(value)]
+        if value % 3:
+            return parser.parse_args(args)
+        return parser.parse_intermixed_args(args)
+
+    with ThreadPoolExecutor(8) as executor:
+        results = list(executor.map(parse, range(1000)))
+    assert results == [
+        Namespace(x=value, foo=str(-value), bar=str(value)) for value in range(1000)
+    ]
+
+
+def test_pickle_parser():
+    parser = NegativeArgumentParser(prog="PROG")
+    group = parser.add_argument_group("group")
+    group.add_argument("-x")
+    parser.add_argument("foo", type=NegInt)
+    restored = pickle.loads(pickle.dumps(parser))
+    assert restored.parse_args(["-x", "-1", "-2"]) == Namespace(x="-1", foo=-2)
+    assert restored.parse_many(["-x a"])[0].message.startswith("usage: PROG")
+
+
+def test_parse_bulk():
+    parser = NegativeArgumentParser(prog="PROG")
+    parser.add_argument("-x", type=NegInt)
+    parser.add_argument("foo")
+    argvs = [["-1", "-x", str(-value)] for value in range(20)]
+    argvs += ["'-2 3' -x 4", "-x 'a", "-x a b", ["-5"]]
+    results = list(parser.parse_bulk(iter(argvs), processes=2, chunksize=3))
+    assert results[:20] == [Namespace(x=-value, foo="-1") for value in range(20)]
+    assert results[20] == Namespace(x=4, foo="-2 3")
+    assert results[21].message.endswith("PROG: error: No closing quotation\n")
+    assert results[22].status == 2
+    assert results[23] == Namespace(x=None, foo="-5")